@@ -14,16 +14,18 @@ from past.utils import old_div
 import argparse
 import configparser
 import getpass
+import gevent.pool
 import logging
 import os
 import re
 import sys
 import urllib3
 
-from ast import literal_eval
 from Equation import Expression
+from importlib import import_module
 
 from isi_data_insights_daemon import (
+    MAX_ASYNC_QUERIES,
     StatsConfig,
     ClusterConfig,
     ClusterCompositeStatComputer,
@@ -32,7 +34,6 @@ from isi_data_insights_daemon import (
     DerivedStatInput,
 )
 from isi_stats_client import IsiStatsClient
-import isi_sdk_utils
 
 
 LOG = logging.getLogger(__name__)
@@ -63,68 +64,140 @@ def avg(stat_values):
 # operations use by ClusterCompositeStatComputer
 COMPOSITE_OPERATIONS = {"avg": avg, "max": max, "min": min, "sum": sum}
 
-# keep track of auth data that we have username and passwords for so that we
-# don't prompt more than once.
-g_cluster_auth_data = {}
-# keep track of the name and version of each cluster
-g_cluster_configs = {}
+# accepted string values of the optional verify_ssl bool on cluster configs.
+BOOL_STRINGS = {
+    "true": True,
+    "false": False,
+    "yes": True,
+    "no": False,
+    "1": True,
+    "0": False,
+}
+
+# map of the supported log_level param values to logging levels.
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# expected format of each cluster config: [username:password@]address[:bool]
+# the password can potentially contain ":" and "@" characters, so the greedy
+# match of the username and password extends up to the last "@".
+CLUSTER_CONFIG_RE = re.compile(r"^(?:(.*)@)?([^@:]+)(?::(.*))?$")
+
+
+class _ClusterState(object):
+    """
+    The auth data and SDK configuration that is known about a cluster.
+    """
+
+    __slots__ = (
+        "username",
+        "password",
+        "verify_ssl",
+        "name",
+        "version",
+        "isi_sdk",
+        "api_client",
+    )
+
+    def __init__(self):
+        self.username = None
+        self.password = None
+        self.verify_ssl = None
+        self.name = None
+        self.version = None
+        self.isi_sdk = None
+        self.api_client = None
+
+
+# keep track of the auth data that we have username and passwords for, so that
+# we don't prompt more than once, and of the name, version and SDK
+# configuration of each cluster, keyed by cluster address.
+g_clusters = {}
+# keep track of the stats metadata queried from each cluster, keyed by the
+# cluster address and stat name, so that stats shared by multiple stat groups
+# are only queried once.
+g_stats_metadata = {}
+
+
+def _die(msg):
+    """
+    Print msg to stderr and exit with an error status.
+    """
+    print(msg, file=sys.stderr)
+    sys.exit(1)
+
+
+def _remove_duplicates(items):
+    """
+    Return a list of the unique items in items, in their original order.
+    """
+    seen = set()
+    unique_items = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            unique_items.append(item)
+    return unique_items
 
 
 def _add_cluster_auth_data(cluster_address, username, password, verify_ssl):
     # update cluster auth data
-    g_cluster_auth_data[cluster_address] = (username, password, verify_ssl)
+    cluster_state = g_clusters.setdefault(cluster_address, _ClusterState())
+    cluster_state.username = username
+    cluster_state.password = password
+    cluster_state.verify_ssl = verify_ssl
+
+
+def _parse_cluster_config(cluster_config):
+    """
+    Parse a [username:password@]address[:bool] cluster config into a tuple of
+    address, username, password and verify_ssl. The auth params are None if
+    they were not provided.
+    """
+    cluster_match = CLUSTER_CONFIG_RE.match(cluster_config)
+    if cluster_match is None:
+        raise RuntimeError("Expected [<username>:<password>@]<address>[:True|False].")
+    user_pass, cluster_address, verify_ssl_param = cluster_match.groups()
+    if user_pass is not None:
+        user_pass_split = user_pass.split(":", 1)
+        if len(user_pass_split) != 2:
+            raise RuntimeError("Expected <username>:<password> prefix.")
+        username, password = user_pass_split
+        # If they provide a username and password then verify_ssl defaults
+        # to false. Otherwise, unless they explicity provide it in the
+        # config, we will prompt them for that parameter when we prompt for
+        # the username and password.
+        verify_ssl = False
+    else:
+        username = None
+        password = None
+        verify_ssl = None
+    if verify_ssl_param is not None:
+        # try to convert to a bool
+        verify_ssl = BOOL_STRINGS.get(verify_ssl_param.strip().lower())
+        if verify_ssl is None:
+            raise RuntimeError("Expected True or False on end.")
+
+    return cluster_address, username, password, verify_ssl
 
 
 def _process_config_file_clusters(clusters):
     cluster_list = []
-    cluster_configs = clusters.split()
-    for cluster_config in cluster_configs:
-        # expected [username:password@]address[:bool]
-        # the password can potentially contain ":" and "@" characters, split is done
-        # from right side first and then left side to isolate out the password.
-        at_split = cluster_config.split("@")
-        if len(at_split) > 2:
-            leftside = "@".join(at_split[:-1])
-            rightside = at_split[-1:]
-            at_split = [leftside, rightside]
-        if len(at_split) == 2:
-            user_pass_split = at_split[0].split(":", 1)
-            if len(user_pass_split) != 2:
-                print(
-                    "Config file contains invalid cluster "
-                    "config: %s in %s (expected <username>:<password> "
-                    "prefix)." % (cluster_config, clusters),
-                    file=sys.stderr,
-                )
-                sys.exit(1)
-            username = user_pass_split[0]
-            password = user_pass_split[1]
-            # If they provide a username and password then verify_ssl defaults
-            # to false. Otherwise, unless they explicity provide it in the
-            # config, we will prompt them for that parameter when we prompt for
-            # the username and password.
-            verify_ssl = False
-        else:
-            username = None
-            password = None
-            verify_ssl = None
-        verify_ssl_split = at_split[-1].split(":", 1)
-        if len(verify_ssl_split) == 1:
-            cluster_address = verify_ssl_split[0]
-        else:
-            try:
-                # try to convert to a bool
-                verify_ssl = literal_eval(verify_ssl_split[-1])
-                if type(verify_ssl) != bool:
-                    raise Exception
-            except Exception:
-                print(
-                    "Config file contains invalid cluster "
-                    "config: %s (expected True or False on end)" % cluster_config,
-                    file=sys.stderr,
-                )
-                sys.exit(1)
-            cluster_address = verify_ssl_split[0]
+    for cluster_config in clusters.split():
+        try:
+            cluster_address, username, password, verify_ssl = _parse_cluster_config(
+                cluster_config
+            )
+        except RuntimeError as rterr:
+            _die(
+                "Config file contains invalid cluster "
+                "config: %s in %s. %s" % (cluster_config, clusters, str(rterr))
+            )
         # add to cache of known cluster auth usernames and passwords
         _add_cluster_auth_data(cluster_address, username, password, verify_ssl)
         cluster_list.append(cluster_address)
@@ -133,30 +206,30 @@ def _process_config_file_clusters(clusters):
 
 
 def _get_cluster_auth_data(cluster):
-    try:
-        username = password = verify_ssl = None
-        # check if we already know the username and password
-        username, password, verify_ssl = g_cluster_auth_data[cluster]
-        if username is None or password is None or verify_ssl is None:
-            # this happens when some of the auth params were provided in the
-            # config file or cli, but not all.
-            raise KeyError
-    except KeyError:
-        # get username and password for input clusters
-        if username is None:
-            username = input(
-                "Please provide the username used to access " + cluster + " via PAPI: "
-            )
-        if password is None:
-            password = getpass.getpass("Password: ")
-        while verify_ssl is None:
-            verify_ssl_resp = input("Verify SSL cert [y/n]: ")
-            if verify_ssl_resp == "yes" or verify_ssl_resp == "y":
-                verify_ssl = True
-            elif verify_ssl_resp == "no" or verify_ssl_resp == "n":
-                verify_ssl = False
-        # add to cache of known cluster auth usernames and passwords
-        _add_cluster_auth_data(cluster, username, password, verify_ssl)
+    # check if we already know the username and password
+    cluster_state = g_clusters.setdefault(cluster, _ClusterState())
+    username = cluster_state.username
+    password = cluster_state.password
+    verify_ssl = cluster_state.verify_ssl
+    if username is not None and password is not None and verify_ssl is not None:
+        return username, password, verify_ssl
+
+    # some or all of the auth params were not provided in the config file or
+    # cli, so prompt for the missing ones.
+    if username is None:
+        username = input(
+            "Please provide the username used to access " + cluster + " via PAPI: "
+        )
+    if password is None:
+        password = getpass.getpass("Password: ")
+    while verify_ssl is None:
+        verify_ssl_resp = input("Verify SSL cert [y/n]: ")
+        if verify_ssl_resp == "yes" or verify_ssl_resp == "y":
+            verify_ssl = True
+        elif verify_ssl_resp == "no" or verify_ssl_resp == "n":
+            verify_ssl = False
+    # add to cache of known cluster auth usernames and passwords
+    _add_cluster_auth_data(cluster, username, password, verify_ssl)
 
     return username, password, verify_ssl
 
@@ -167,41 +240,85 @@ def _query_cluster_name(cluster_address, isi_sdk, api_client):
     try:
         resp = cluster_api.get_cluster_identity()
         return resp.name
-    except isi_sdk.rest.ApiException:
+    except isi_sdk.rest.ApiException as api_exc:
+        if api_exc.status == 403:
+            LOG.warning(
+                "Insufficient privileges to query the cluster identity of %s, "
+                "using its address as the cluster name.",
+                cluster_address,
+            )
         # if get_cluster_identity() doesn't work just use the address
         return cluster_address
 
 
+def _configure_cluster_sdk(cluster, username, password, verify_ssl):
+    """
+    Configure the SDK for the specified cluster and query its name. Returns a
+    tuple consisting of the cluster name, the isi_sdk interface, the
+    api_client and the cluster version.
+    """
+    # importing the SDKs is expensive, so wait until a cluster actually needs
+    # to be configured (i.e. not for stop or --help).
+    import isi_sdk_utils
+
+    try:
+        isi_sdk, api_client, version = isi_sdk_utils.configure(
+            cluster, username, password, verify_ssl
+        )
+    except RuntimeError as exc:
+        _die(
+            "Failed to configure SDK for "
+            "cluster %s. Exception raised: %s" % (cluster, str(exc))
+        )
+    print(
+        "Configured %s as version %d cluster, using SDK %s."
+        % (cluster, int(version), isi_sdk.__name__)
+    )
+    cluster_name = _query_cluster_name(cluster, isi_sdk, api_client)
+    return cluster_name, isi_sdk, api_client, version
+
+
 def _build_cluster_configs(cluster_list):
+    # prompt for any missing auth data up front, the prompts have to happen
+    # one at a time.
+    cluster_auth_data = [
+        (cluster,) + _get_cluster_auth_data(cluster) for cluster in cluster_list
+    ]
+    # configure the SDK for the clusters that have not been configured yet,
+    # each configuration requires a round-trip to the cluster so do them
+    # concurrently.
+    new_clusters = [
+        auth_data
+        for auth_data in cluster_auth_data
+        if g_clusters[auth_data[0]].api_client is None
+    ]
+    if new_clusters:
+        # disable the insecure request warnings once up front rather than
+        # for each cluster.
+        if any(auth_data[3] is False for auth_data in new_clusters):
+            urllib3.disable_warnings()
+        pool = gevent.pool.Pool(MAX_ASYNC_QUERIES)
+        results = pool.map(
+            lambda auth_data: _configure_cluster_sdk(*auth_data), new_clusters
+        )
+        for auth_data, result in zip(new_clusters, results):
+            cluster_state = g_clusters[auth_data[0]]
+            (
+                cluster_state.name,
+                cluster_state.isi_sdk,
+                cluster_state.api_client,
+                cluster_state.version,
+            ) = result
+
     cluster_configs = []
     for cluster in cluster_list:
-        username, password, verify_ssl = _get_cluster_auth_data(cluster)
-
-        if cluster in g_cluster_configs:
-            cluster_name, isi_sdk, api_client, version = g_cluster_configs[cluster]
-        else:
-            if verify_ssl is False:
-                urllib3.disable_warnings()
-            try:
-                isi_sdk, api_client, version = isi_sdk_utils.configure(
-                    cluster, username, password, verify_ssl
-                )
-            except RuntimeError as exc:
-                print(
-                    "Failed to configure SDK for "
-                    "cluster %s. Exception raised: %s" % (cluster, str(exc)),
-                    file=sys.stderr,
-                )
-                sys.exit(1)
-            print(
-                "Configured %s as version %d cluster, using SDK %s."
-                % (cluster, int(version), isi_sdk.__name__)
-            )
-            cluster_name = _query_cluster_name(cluster, isi_sdk, api_client)
-            g_cluster_configs[cluster] = cluster_name, isi_sdk, api_client, version
-
+        cluster_state = g_clusters[cluster]
         cluster_config = ClusterConfig(
-            cluster, cluster_name, version, isi_sdk, api_client
+            cluster,
+            cluster_state.name,
+            cluster_state.version,
+            cluster_state.isi_sdk,
+            cluster_state.api_client,
         )
         cluster_configs.append(cluster_config)
 
@@ -253,9 +370,19 @@ def _query_stats_metadata(cluster, stat_names):
     Query the specified cluster for the metadata of the stats specified in
     stat_names list.
     """
-    stats_api = cluster.isi_sdk.StatisticsApi(cluster.api_client)
-    isi_stats_client = IsiStatsClient(stats_api)
-    return isi_stats_client.get_stats_metadata(stat_names)
+    # only query the cluster for the stats that are not already cached
+    missing_stat_names = [
+        stat_name
+        for stat_name in stat_names
+        if (cluster.address, stat_name) not in g_stats_metadata
+    ]
+    if missing_stat_names:
+        stats_api = cluster.isi_sdk.StatisticsApi(cluster.api_client)
+        isi_stats_client = IsiStatsClient(stats_api)
+        stats_metadata = isi_stats_client.get_stats_metadata(missing_stat_names)
+        for stat_name, stat_metadata in zip(missing_stat_names, stats_metadata):
+            g_stats_metadata[(cluster.address, stat_name)] = stat_metadata
+    return [g_stats_metadata[(cluster.address, stat_name)] for stat_name in stat_names]
 
 
 def _compute_stat_group_update_intervals(
@@ -280,60 +407,120 @@ def _compute_stat_group_update_intervals(
                 )
             # the policy intervals seem to override the default cache time
             if stat_metadata.policies:
-                smallest_interval = cache_time
-                for policy in stat_metadata.policies:
-                    if smallest_interval == -1:
-                        smallest_interval = policy.interval
-                    else:
-                        smallest_interval = min(policy.interval, smallest_interval)
-                cache_time = smallest_interval * update_interval_multiplier
+                policy_intervals = [
+                    policy.interval for policy in stat_metadata.policies
+                ]
+                if cache_time != -1:
+                    policy_intervals.append(cache_time)
+                cache_time = min(policy_intervals) * update_interval_multiplier
             # if the cache_time is still -1 then it means that the statistic is
             # continually updated, so the fastest it can be queried is
             # once every second.
             if cache_time == -1:
                 cache_time = ONE_SEC * update_interval_multiplier
-            try:
-                update_interval = update_intervals[cache_time]
-                update_interval[0].add(cluster)
-                update_interval[1].add(stat_name)
-            except KeyError:
-                # insert a new interval time
-                update_intervals[cache_time] = (set([cluster]), set([stat_name]))
+            # insert a new interval time (if needed)
+            update_interval = update_intervals.setdefault(cache_time, (set(), set()))
+            update_interval[0].add(cluster)
+            update_interval[1].add(stat_name)
 
 
-def _configure_stat_groups_via_file(
-    daemon, config_file, stat_group, global_cluster_list
-):
-    cluster_list = []
-    cluster_list.extend(global_cluster_list)
-    try:
-        # process clusters specific to this stat group (if any)
+class _StatGroup(object):
+    """
+    The clusters, stats and update interval parsed from a stat group section
+    of the config file. Either update_interval or update_interval_multiplier
+    is set, depending on whether the update interval is fixed or relative to
+    the stats' collection intervals.
+    """
+
+    def __init__(
+        self, name, clusters, stats, update_interval, update_interval_multiplier
+    ):
+        self.name = name
+        self.clusters = clusters
+        self.stats = stats
+        self.update_interval = update_interval
+        self.update_interval_multiplier = update_interval_multiplier
+
+
+def _parse_stat_group_via_file(config_file, stat_group, global_cluster_list):
+    cluster_list = global_cluster_list
+    # process clusters specific to this stat group (if any)
+    if config_file.has_option(stat_group, "clusters") is True:
         clusters_param = config_file.get(stat_group, "clusters")
         stat_group_clusters = _process_config_file_clusters(clusters_param)
-        cluster_list.extend(stat_group_clusters)
-        # remove duplicates
-        cluster_list = list(set(cluster_list))
-    except configparser.NoOptionError:
-        pass
+        cluster_list = _remove_duplicates(global_cluster_list + stat_group_clusters)
 
     if len(cluster_list) == 0:
-        print(
-            "The %s stat group has no clusters to query." % stat_group, file=sys.stderr
-        )
-        print(
+        _die(
+            "The %s stat group has no clusters to query.\n"
             "You must provide either a global list of "
             "clusters to query for all stat groups, or a per-stat-"
-            "group list of clusters, or both.",
-            file=sys.stderr,
+            "group list of clusters, or both." % stat_group
         )
-        sys.exit(1)
 
-    cluster_configs = _build_cluster_configs(cluster_list)
+    stat_names = _remove_duplicates(config_file.get(stat_group, "stats").split())
 
     update_interval_param = config_file.get(stat_group, "update_interval")
-    stat_names = config_file.get(stat_group, "stats").split()
-    # remove duplicates
-    stat_names = list(set(stat_names))
+    update_interval = update_interval_multiplier = None
+    if update_interval_param.startswith("*"):
+        try:
+            update_interval_multiplier = (
+                1 if update_interval_param == "*" else int(update_interval_param[1:])
+            )
+        except ValueError as exc:
+            _die(
+                "Failed to parse update interval multiplier "
+                "from %s stat group.\nERROR: %s" % (stat_group, str(exc))
+            )
+    else:
+        try:
+            update_interval = int(update_interval_param)
+        except ValueError as exc:
+            _die(
+                "Failed to parse update interval from %s "
+                "stat group.\nERROR: %s" % (stat_group, str(exc))
+            )
+
+    return _StatGroup(
+        stat_group,
+        cluster_list,
+        stat_names,
+        update_interval,
+        update_interval_multiplier,
+    )
+
+
+def _prefetch_stats_metadata(stat_groups, cluster_configs):
+    """
+    Query the metadata of the stats of all the stat groups that have update
+    intervals relative to the stats' collection intervals, with one
+    concurrent query per cluster, so that computing each stat group's update
+    intervals is served from g_stats_metadata.
+    """
+    cluster_stat_names = {}
+    for stat_group in stat_groups:
+        if stat_group.update_interval_multiplier is not None:
+            for cluster in stat_group.clusters:
+                cluster_stat_names.setdefault(cluster, []).extend(stat_group.stats)
+
+    pool = gevent.pool.Pool(MAX_ASYNC_QUERIES)
+    pool.map(
+        lambda item: _query_stats_metadata(
+            cluster_configs[item[0]], _remove_duplicates(item[1])
+        ),
+        cluster_stat_names.items(),
+    )
+
+
+def _configure_stat_groups_via_file(
+    daemon,
+    config_file,
+    stat_group,
+    cluster_configs,
+    stat_names,
+    update_interval,
+    update_interval_multiplier,
+):
     # deal with derived stats (if any)
     composite_stats = []
     if config_file.has_option(stat_group, "composite_stats") is True:
@@ -358,32 +545,12 @@ def _configure_stat_groups_via_file(
         )
 
     update_intervals = {}
-    if update_interval_param.startswith("*"):
-        try:
-            update_interval_multiplier = (
-                1 if update_interval_param == "*" else int(update_interval_param[1:])
-            )
-        except ValueError as exc:
-            print(
-                "Failed to parse update interval multiplier "
-                "from %s stat group.\nERROR: %s" % (stat_group, str(exc)),
-                file=sys.stderr,
-            )
-            sys.exit(1)
+    if update_interval_multiplier is not None:
         print("Computing update intervals for stat group: %s." % stat_group)
         _compute_stat_group_update_intervals(
             update_interval_multiplier, cluster_configs, stat_names, update_intervals
         )
     else:
-        try:
-            update_interval = int(update_interval_param)
-        except ValueError as exc:
-            print(
-                "Failed to parse update interval from %s "
-                "stat group.\nERROR: %s" % (stat_group, str(exc)),
-                file=sys.stderr,
-            )
-            sys.exit(1)
         update_intervals[update_interval] = (cluster_configs, stat_names)
 
     # TODO - fix this - for now if there are derived stats then we are going to
@@ -428,12 +595,10 @@ def _parse_derived_stats(config_file, stat_group, derived_stats_name, parse_func
     try:
         derived_stats = parse_func(derived_stats_cfg)
     except RuntimeError as rterr:
-        print(
+        _die(
             "Failed to parse %s from %s "
-            "section. %s" % (derived_stats_name, stat_group, str(rterr)),
-            file=sys.stderr,
+            "section. %s" % (derived_stats_name, stat_group, str(rterr))
         )
-        sys.exit(1)
 
     return derived_stats
 
@@ -553,12 +718,10 @@ def _parse_pct_change_stats(pct_change_stats_cfg):
 
 def _configure_stat_groups_via_cli(daemon, args):
     if len(args.stat_groups) == 0:
-        print(
+        _die(
             "You must provide a set of stats to query via "
-            "the --stats command line argument or a configuration file.",
-            file=sys.stderr,
+            "the --stats command line argument or a configuration file."
         )
-        sys.exit(1)
 
     if not args.update_intervals:
         # for some reason if i try to use default=[MIN_UPDATE_INTERVAL] in the
@@ -568,21 +731,17 @@ def _configure_stat_groups_via_cli(daemon, args):
         args.update_intervals.append(MIN_UPDATE_INTERVAL)
 
     if len(args.stat_groups) != len(args.update_intervals):
-        print(
+        _die(
             "The number of update intervals must be the "
-            + "same as the number of stat groups.",
-            file=sys.stderr,
+            "same as the number of stat groups."
         )
-        sys.exit(1)
 
     cluster_list = args.clusters.split(",")
     # if args.clusters is the empty string then 1st element will be empty
     if cluster_list[0] == "":
-        print("Please provide at least one input cluster.", file=sys.stderr)
-        sys.exit(1)
+        _die("Please provide at least one input cluster.")
 
-    # remove duplicates
-    cluster_list = list(set(cluster_list))
+    cluster_list = _remove_duplicates(cluster_list)
     cluster_configs = _build_cluster_configs(cluster_list)
 
     for index in range(0, len(args.stat_groups)):
@@ -590,45 +749,33 @@ def _configure_stat_groups_via_cli(daemon, args):
         # split always results in at least one item, so check if the first
         # item is empty to validate the stats input arg
         if stats_list[0] == "":
-            print("Please provide at least one stat name.", file=sys.stderr)
-            sys.exit(1)
+            _die("Please provide at least one stat name.")
         update_interval = args.update_intervals[index]
         _configure_stat_group(daemon, update_interval, cluster_configs, stats_list)
 
 
 def _configure_stats_processor(daemon, stats_processor, processor_args):
     try:
-        processor = __import__(stats_processor, fromlist=[""])
+        processor = import_module(stats_processor)
     except ImportError:
-        print("Unable to load stats processor: %s." % stats_processor, file=sys.stderr)
-        sys.exit(1)
+        _die("Unable to load stats processor: %s." % stats_processor)
 
     try:
         arg_list = processor_args.split(" ") if processor_args != "" else []
         daemon.set_stats_processor(processor, arg_list)
     except AttributeError as exception:
-        print(
+        _die(
             "Failed to configure %s as stats processor. %s"
-            % (stats_processor, str(exception)),
-            file=sys.stderr,
+            % (stats_processor, str(exception))
         )
-        sys.exit(1)
 
 
 def _log_level_str_to_enum(log_level):
-    if log_level.upper() == "DEBUG":
-        return logging.DEBUG
-    elif log_level.upper() == "INFO":
-        return logging.INFO
-    elif log_level.upper() == "WARNING":
-        return logging.WARNING
-    elif log_level.upper() == "ERROR":
-        return logging.ERROR
-    elif log_level.upper() == "CRITICAL":
-        return logging.CRITICAL
-    else:
+    level = LOG_LEVELS.get(log_level.upper())
+    if level is None:
         print("Invalid logging level: " + log_level + ", setting to INFO.")
         return logging.INFO
+    return level
 
 
 def _update_args_with_config_file(config_file, args):
@@ -663,34 +810,31 @@ def configure_via_file(daemon, args, config_file):
     arguments and configuration file. The command line args override settings
     provided in the config file.
     """
+    # snapshot the main section once rather than looking up each param
+    # through the config parser.
+    main_cfg = (
+        dict(config_file.items(MAIN_CFG_SEC))
+        if config_file.has_section(MAIN_CFG_SEC)
+        else {}
+    )
     # Command line args override config file params
-    if (
-        not args.stats_processor
-        and config_file.has_option(MAIN_CFG_SEC, "stats_processor") is True
-    ):
-        args.stats_processor = config_file.get(MAIN_CFG_SEC, "stats_processor")
-    if (
-        not args.processor_args
-        and config_file.has_option(MAIN_CFG_SEC, "stats_processor_args") is True
-    ):
-        args.processor_args = config_file.get(MAIN_CFG_SEC, "stats_processor_args")
+    if not args.stats_processor and "stats_processor" in main_cfg:
+        args.stats_processor = main_cfg["stats_processor"]
+    if not args.processor_args and "stats_processor_args" in main_cfg:
+        args.processor_args = main_cfg["stats_processor_args"]
     _configure_stats_processor(daemon, args.stats_processor, args.processor_args)
 
     # check if the MAIN_CFG_SEC has the MIN_UPDATE_INTERVAL_OVERRIDE_PARAM
-    if config_file.has_option(MAIN_CFG_SEC, MIN_UPDATE_INTERVAL_OVERRIDE_PARAM):
+    if MIN_UPDATE_INTERVAL_OVERRIDE_PARAM in main_cfg:
         global MIN_UPDATE_INTERVAL
         try:
-            override_update_interval = int(
-                config_file.get(MAIN_CFG_SEC, MIN_UPDATE_INTERVAL_OVERRIDE_PARAM)
-            )
+            override_update_interval = int(main_cfg[MIN_UPDATE_INTERVAL_OVERRIDE_PARAM])
         except ValueError as exc:
-            print(
+            _die(
                 "Failed to parse %s from %s "
                 "section.\nERROR: %s"
-                % (MIN_UPDATE_INTERVAL_OVERRIDE_PARAM, MAIN_CFG_SEC, str(exc)),
-                file=sys.stderr,
+                % (MIN_UPDATE_INTERVAL_OVERRIDE_PARAM, MAIN_CFG_SEC, str(exc))
             )
-            sys.exit(1)
 
         LOG.warning(
             "Overriding MIN_UPDATE_INTERVAL of %d seconds with " "%d seconds.",
@@ -706,29 +850,42 @@ def configure_via_file(daemon, args, config_file):
     global_cluster_list = []
     if args.clusters:
         global_cluster_list = args.clusters.split(",")
-    elif config_file.has_option(MAIN_CFG_SEC, "clusters"):
-        global_cluster_list = _process_config_file_clusters(
-            config_file.get(MAIN_CFG_SEC, "clusters")
-        )
-    # remove duplicates
-    global_cluster_list = list(set(global_cluster_list))
+    elif "clusters" in main_cfg:
+        global_cluster_list = _process_config_file_clusters(main_cfg["clusters"])
+    global_cluster_list = _remove_duplicates(global_cluster_list)
 
     # now configure with config file params too
-    if config_file.has_option(MAIN_CFG_SEC, "active_stat_groups"):
-        active_stat_groups = config_file.get(MAIN_CFG_SEC, "active_stat_groups").split()
-        for stat_group in active_stat_groups:
+    if "active_stat_groups" in main_cfg:
+        active_stat_groups = main_cfg["active_stat_groups"].split()
+        # parse all the stat groups first so that the clusters are configured
+        # in a single pass and each stat group shares the same ClusterConfig
+        # instances.
+        stat_groups = [
+            _parse_stat_group_via_file(config_file, stat_group, global_cluster_list)
+            for stat_group in active_stat_groups
+        ]
+        all_clusters = _remove_duplicates(
+            cluster for stat_group in stat_groups for cluster in stat_group.clusters
+        )
+        cluster_configs = dict(zip(all_clusters, _build_cluster_configs(all_clusters)))
+        _prefetch_stats_metadata(stat_groups, cluster_configs)
+        for stat_group in stat_groups:
             _configure_stat_groups_via_file(
-                daemon, config_file, stat_group, global_cluster_list
+                daemon,
+                config_file,
+                stat_group.name,
+                [cluster_configs[cluster] for cluster in stat_group.clusters],
+                stat_group.stats,
+                stat_group.update_interval,
+                stat_group.update_interval_multiplier,
             )
 
     # check that at least one stat group was added to the daemon.
     if daemon.get_stat_set_count() == 0:
-        print(
+        _die(
             "Please provide stat groups to query via "
-            "command line args or via config file parameters.",
-            file=sys.stderr,
+            "command line args or via config file parameters."
         )
-        sys.exit(1)
 
     _print_stat_groups(daemon)
 
@@ -754,8 +911,7 @@ def configure_logging_via_cli(args):
 
         parent_dir = os.path.dirname(args.log_file)
         if parent_dir and os.path.exists(parent_dir) is False:
-            print("Invalid log file path: %s." % (args.log_file), file=sys.stderr)
-            sys.exit(1)
+            _die("Invalid log file path: %s." % (args.log_file))
 
         if args.log_level is None:
             args.log_level = DEFAULT_LOG_LEVEL
@@ -785,14 +941,12 @@ def configure_args_via_file(args):
         try:
             config_file = configparser.RawConfigParser()
             with open(args.config_file, "r") as cfg_fp:
-                config_file.readfp(cfg_fp)
+                config_file.read_file(cfg_fp)
         except Exception as exc:
-            print(
+            _die(
                 "Failed to parse config file: %s.\n"
-                "ERROR:\n%s." % (args.config_file, str(exc)),
-                file=sys.stderr,
+                "ERROR:\n%s." % (args.config_file, str(exc))
             )
-            sys.exit(1)
         _update_args_with_config_file(config_file, args)
     return config_file
 
@@ -807,15 +961,13 @@ def process_pid_file_arg(pid_file, action):
 
     parent_dir = os.path.dirname(pid_file)
     if parent_dir and os.path.exists(parent_dir) is False:
-        print("Invalid pid file path: %s." % pid_file, file=sys.stderr)
-        sys.exit(1)
+        _die("Invalid pid file path: %s." % pid_file)
 
     pid_file_path = os.path.abspath(pid_file)
     if (action == "stop" or action == "restart") and os.path.exists(
         pid_file_path
     ) is False:
-        print("Invalid pid file path: %s." % pid_file, file=sys.stderr)
-        sys.exit(1)
+        _die("Invalid pid file path: %s." % pid_file)
 
     return pid_file_path
 
@@ -829,6 +981,7 @@ def parse_cli():
     )
     argparser.add_argument(
         "action",
+        choices=["start", "stop", "restart", "debug"],
         help="Specifies to 'start', 'stop', " "'restart', or 'debug' the daemon.",
     )
     argparser.add_argument(
@@ -864,6 +1017,8 @@ def parse_cli():
         dest="log_level",
         help="Set the logging level (debug, info, warning, error, or " "critical).",
         action="store",
+        type=lambda log_level: log_level.lower(),
+        choices=["debug", "info", "warning", "error", "critical"],
         default=None,
     )
     argparser.add_argument(
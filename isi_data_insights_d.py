@@ -63,15 +63,9 @@ def main():
             daemon.restart()
         else:
             daemon.run(debug=True)
-    elif args.action == "stop":
+    else:  # argparse only allows 'stop' at this point
         print("Stopping daemon with pid " + str(daemon.pid))
         daemon.stop()
-    else:
-        print(
-            "Invalid action arg: '%s', must be one of "
-            "'start', 'stop', or 'restart'." % args.action,
-            file=sys.stderr,
-        )
 
 
 if __name__ == "__main__":
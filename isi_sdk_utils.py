@@ -45,10 +45,11 @@ def configure(host, username, password, verify_ssl=False, use_version="detect"):
     if isi_sdk_7_2 is None and isi_sdk_8_0 is None:
         raise RuntimeError("Isilon SDK is not installed.")
 
-    host_url = "https://" + host + ":8080"
-
+    detect_sdk = detect_api_client = None
     if use_version is None or use_version == "detect":
-        host_version = _detect_host_version(host, username, password, verify_ssl)
+        host_version, detect_sdk, detect_api_client = _detect_host_version(
+            host, username, password, verify_ssl
+        )
     else:
         host_version = use_version
 
@@ -63,14 +64,23 @@ def configure(host, username, password, verify_ssl=False, use_version="detect"):
     else:
         isi_sdk = isi_sdk_8_0
 
+    if isi_sdk is detect_sdk:
+        # reuse the client (and its connection pool) that was used to detect
+        # the host version rather than opening new connections to the host.
+        api_client = detect_api_client
+    else:
+        api_client = _build_api_client(isi_sdk, host, username, password, verify_ssl)
+
+    return isi_sdk, api_client, host_version
+
+
+def _build_api_client(isi_sdk, host, username, password, verify_ssl):
     configuration = isi_sdk.Configuration()
     configuration.username = username
     configuration.password = password
     configuration.verify_ssl = verify_ssl
-    configuration.host = host_url
-    api_client = isi_sdk.ApiClient(configuration)
-
-    return isi_sdk, api_client, host_version
+    configuration.host = "https://" + host + ":8080"
+    return isi_sdk.ApiClient(configuration)
 
 
 def _detect_host_version(host, username, password, verify_ssl):
@@ -78,12 +88,7 @@ def _detect_host_version(host, username, password, verify_ssl):
     # because it will work for 7.2 or newer clusters.
     isi_sdk = isi_sdk_7_2 if isi_sdk_7_2 else isi_sdk_8_0
 
-    configuration = isi_sdk.Configuration()
-    configuration.username = username
-    configuration.password = password
-    configuration.verify_ssl = verify_ssl
-    configuration.host = "https://" + host + ":8080"
-    api_client = isi_sdk.ApiClient(configuration)
+    api_client = _build_api_client(isi_sdk, host, username, password, verify_ssl)
 
     try:
         try:
@@ -120,4 +125,4 @@ def _detect_host_version(host, username, password, verify_ssl):
             file=sys.stderr,
         )
 
-    return host_version
+    return host_version, isi_sdk, api_client